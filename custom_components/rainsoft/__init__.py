@@ -3,21 +3,41 @@ from __future__ import annotations
 
 from datetime import timedelta
 import logging
+import sys
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    EVENT_HOMEASSISTANT_CLOSE,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import RainsoftApiClient, RainsoftApiError, RainsoftAuthError
-from .const import CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN
-from .coordinator import RainsoftDataUpdateCoordinator
+from .const import (
+    API_CONNECTION_LIMIT,
+    API_CONNECTION_LIMIT_PER_HOST,
+    API_DNS_CACHE_TTL,
+    API_KEEPALIVE_TIMEOUT,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
+from .coordinator import RainsoftDataUpdateCoordinator, RainsoftInfoCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
 
+# Python 3.12.7+ and 3.13.1+ close aborted TLS transports on their own, and
+# aiohttp deprecates enable_cleanup_closed there
+_ENABLE_CLEANUP_CLOSED = sys.version_info < (3, 12, 7) or (
+    (3, 13) <= sys.version_info < (3, 13, 1)
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Rainsoft from a config entry.
@@ -47,8 +67,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "Scan interval: %d hours (%s)", scan_interval_hours, scan_interval
     )
 
-    # Create API client
-    session = async_get_clientsession(hass)
+    # Create API client on a dedicated session so the requests of a refresh
+    # reuse kept-alive connections to the Rainsoft host
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=API_CONNECTION_LIMIT,
+            limit_per_host=API_CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=API_DNS_CACHE_TTL,
+            keepalive_timeout=API_KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=_ENABLE_CLEANUP_CLOSED,
+        )
+    )
+    # Closed on unload, and also when setup below fails
+    entry.async_on_unload(session.close)
+
+    async def _async_close_session(_event: Event) -> None:
+        """Close the session, since entries are not unloaded at shutdown."""
+        await session.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
     api = RainsoftApiClient(session, email, password)
 
     # Authenticate
@@ -65,11 +104,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("API error during setup: %s", err)
         raise ConfigEntryNotReady(f"API error: {err}") from err
 
-    # Create coordinator
-    coordinator = RainsoftDataUpdateCoordinator(hass, api, scan_interval)
+    # Create coordinators: slow-changing device list and locations, and the
+    # device state that entities subscribe to
+    info_coordinator = RainsoftInfoCoordinator(hass, api)
+    coordinator = RainsoftDataUpdateCoordinator(
+        hass, api, info_coordinator, scan_interval
+    )
 
     # Fetch initial data
     try:
+        await info_coordinator.async_config_entry_first_refresh()
         await coordinator.async_config_entry_first_refresh()
     except ConfigEntryAuthFailed:
         raise
@@ -77,13 +121,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Error fetching initial data: %s", err)
         raise ConfigEntryNotReady(f"Error fetching data: {err}") from err
 
-    # Store coordinator
+    # The info coordinator has no entities; this listener keeps it polling
+    # and refreshes device state whenever the device list changes
+    entry.async_on_unload(
+        info_coordinator.async_add_listener(coordinator.async_handle_info_update)
+    )
+
+    # Store coordinators
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data[DOMAIN][entry.entry_id] = {
+        "info": info_coordinator,
+        "state": coordinator,
+    }
 
     _LOGGER.info(
         "Rainsoft integration setup complete with %d device(s)",
-        len(coordinator.devices),
+        len(info_coordinator.data),
     )
 
     # Forward to platforms
@@ -110,7 +163,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    # Remove coordinator from hass.data if unload successful
+    # Remove coordinators from hass.data if unload successful
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
         _LOGGER.info("Rainsoft integration unloaded successfully")
@@ -2,17 +2,21 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator
 import logging
 from typing import Any
 
 import aiohttp
 from aiohttp import ClientSession, ClientTimeout
+import orjson
 
 from .const import (
     API_BASE_URL,
     API_HEADER_ACCEPT,
+    API_HEADER_ACCEPT_ENCODING,
     API_HEADER_AUTH,
     API_HEADER_ORIGIN,
+    API_MAX_CONCURRENCY,
     API_TIMEOUT,
 )
 
@@ -48,6 +52,19 @@ class RainsoftApiClient:
         self._token: str | None = None
         self._customer_id: str | None = None
         self._base_url = API_BASE_URL
+        self._base_headers = {
+            aiohttp.hdrs.ACCEPT: API_HEADER_ACCEPT,
+            aiohttp.hdrs.ACCEPT_ENCODING: API_HEADER_ACCEPT_ENCODING,
+            aiohttp.hdrs.ORIGIN: API_HEADER_ORIGIN,
+        }
+        self._sem = asyncio.BoundedSemaphore(API_MAX_CONCURRENCY)
+        # Serializes re-authentication; the generation counts token refreshes
+        self._auth_lock = asyncio.Lock()
+        self._token_gen = 0
+        # Conditional GET validators: url -> (ETag, Last-Modified, parsed body)
+        self._validators: dict[str, tuple[str | None, str | None, Any]] = {}
+        # In-flight GET requests, keyed by method and endpoint
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
 
     async def authenticate(self) -> bool:
         """Authenticate and get token.
@@ -62,14 +79,10 @@ class RainsoftApiClient:
         _LOGGER.debug("Authenticating with Rainsoft API")
 
         try:
-            data = aiohttp.FormData()
-            data.add_field("email", self._email)
-            data.add_field("password", self._password)
-
             response = await self._request(
                 "POST",
                 "/login",
-                data=data,
+                data={"email": self._email, "password": self._password},
                 authenticated=False,
             )
 
@@ -77,7 +90,17 @@ class RainsoftApiClient:
                 raise RainsoftAuthError("Invalid response from login endpoint")
 
             self._token = response["authentication_token"]
+            self._token_gen += 1
             _LOGGER.debug("Authentication successful")
+
+            # Skip the /customer round trip if login already identifies the customer
+            customer_id = response.get("customer_id")
+            customer = response.get("customer")
+            if not customer_id and isinstance(customer, dict):
+                customer_id = customer.get("id")
+            if customer_id:
+                self._customer_id = str(customer_id)
+                _LOGGER.debug("Customer ID from login response: %s", self._customer_id)
             return True
 
         except RainsoftConnectionError:
@@ -88,6 +111,16 @@ class RainsoftApiClient:
             _LOGGER.error("Unexpected error during authentication: %s", err)
             raise RainsoftAuthError(f"Authentication failed: {err}") from err
 
+    async def ensure_authenticated(self) -> None:
+        """Authenticate unless a token is already held.
+
+        Raises:
+            RainsoftAuthError: If authentication fails
+            RainsoftConnectionError: If connection fails
+        """
+        if not self._token:
+            await self._reauthenticate(self._token_gen)
+
     async def get_customer_id(self) -> str:
         """Get customer ID after authentication.
 
@@ -101,6 +134,9 @@ class RainsoftApiClient:
         if not self._token:
             raise RainsoftAuthError("Not authenticated")
 
+        if self._customer_id:
+            return self._customer_id
+
         _LOGGER.debug("Fetching customer ID")
 
         response = await self._request("GET", "/customer")
@@ -112,11 +148,11 @@ class RainsoftApiClient:
         _LOGGER.debug("Customer ID: %s", self._customer_id)
         return self._customer_id
 
-    async def get_devices(self) -> list[dict[str, Any]]:
-        """Get list of devices for customer.
+    async def iter_devices(self) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over devices for customer.
 
-        Returns:
-            List of device dictionaries
+        Yields:
+            Device dictionaries with location info added
 
         Raises:
             RainsoftAuthError: If not authenticated
@@ -132,15 +168,26 @@ class RainsoftApiClient:
         if not response or "locationListData" not in response:
             raise RainsoftApiError("Invalid response from locations endpoint")
 
-        # Extract devices from locations
-        devices = []
+        # Extract devices from locations, merging location info into each
         for location in response["locationListData"]:
-            if "devices" in location:
-                for device in location["devices"]:
-                    # Add location info to device
-                    device["location_id"] = location.get("id")
-                    device["location_name"] = location.get("name")
-                    devices.append(device)
+            location_info = {
+                "location_id": location.get("id"),
+                "location_name": location.get("name"),
+            }
+            for device in location.get("devices") or ():
+                yield device | location_info
+
+    async def get_devices(self) -> list[dict[str, Any]]:
+        """Get list of devices for customer.
+
+        Returns:
+            List of device dictionaries
+
+        Raises:
+            RainsoftAuthError: If not authenticated
+            RainsoftConnectionError: If connection fails
+        """
+        devices = [device async for device in self.iter_devices()]
 
         _LOGGER.debug("Found %d device(s)", len(devices))
         return devices
@@ -149,6 +196,24 @@ class RainsoftApiClient:
         """Get current status for a device (alias for get_device_detail)."""
         return await self.get_device_detail(device_id)
 
+    async def get_all_device_statuses(
+        self, device_ids: list[str]
+    ) -> dict[str, dict[str, Any] | BaseException]:
+        """Get current status for several devices concurrently.
+
+        Args:
+            device_ids: Device IDs to fetch
+
+        Returns:
+            Mapping of device ID to its status, or to the exception raised
+            while fetching it so callers can handle failures per device
+        """
+        results = await asyncio.gather(
+            *(self.get_device_status(device_id) for device_id in device_ids),
+            return_exceptions=True,
+        )
+        return dict(zip(device_ids, results))
+
     async def get_device_detail(self, device_id: str) -> dict[str, Any]:
         """Get detailed data for a device from /device/{id} endpoint.
 
@@ -228,8 +293,9 @@ class RainsoftApiClient:
             "dealer_email": dealer.get("email"),
         }
 
-        system_status = parsed["system_status"].lower() if parsed["system_status"] else ""
-        parsed["regeneration_active"] = "regenerat" in system_status and "queued" not in system_status
+        system_status = parsed["system_status"]
+        status = system_status.casefold() if system_status is not None else ""
+        parsed["regeneration_active"] = "regenerat" in status and "queued" not in status
 
         return parsed
 
@@ -251,6 +317,18 @@ class RainsoftApiClient:
             _LOGGER.warning("Could not convert %s to int, using default %d", value, default)
             return default
 
+    async def _reauthenticate(self, token_gen: int) -> None:
+        """Re-authenticate once for all requests that saw the same token expire.
+
+        Args:
+            token_gen: Token generation the failed request was sent with
+        """
+        async with self._auth_lock:
+            if token_gen == self._token_gen:
+                await self.authenticate()
+            else:
+                _LOGGER.debug("Token already refreshed by another request")
+
     async def _request(
         self,
         method: str,
@@ -274,83 +352,120 @@ class RainsoftApiClient:
             RainsoftConnectionError: If connection fails
             RainsoftApiError: For other API errors
         """
+        # Only plain authenticated GETs are shared, since the key does not
+        # cover params, headers or other request options
+        if method != "GET" or not authenticated or kwargs:
+            return await self._send_request(method, endpoint, authenticated, **kwargs)
+
+        # Identical concurrent GETs share a single in-flight request
+        key = f"{method} {endpoint}"
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._send_request(method, endpoint, authenticated, **kwargs)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        authenticated: bool,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Send a request, re-authenticating and retrying once on a 400."""
         url = f"{self._base_url}{endpoint}"
 
         # Set up headers
-        headers = kwargs.pop("headers", {})
-        headers[aiohttp.hdrs.ACCEPT] = API_HEADER_ACCEPT
-        headers[aiohttp.hdrs.ORIGIN] = API_HEADER_ORIGIN
+        headers = {**kwargs.pop("headers", {}), **self._base_headers}
 
-        if authenticated and self._token:
-            headers[API_HEADER_AUTH] = self._token
+        # Ask the server to skip the body if it has not changed since last time
+        cached = self._validators.get(url) if method == "GET" else None
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers[aiohttp.hdrs.IF_NONE_MATCH] = etag
+            if last_modified:
+                headers[aiohttp.hdrs.IF_MODIFIED_SINCE] = last_modified
 
         # Set timeout
         timeout = ClientTimeout(total=API_TIMEOUT)
 
         try:
-            async with self._session.request(
-                method,
-                url,
-                headers=headers,
-                timeout=timeout,
-                **kwargs,
-            ) as response:
-                response_text = await response.text()
-
-                _LOGGER.debug(
-                    "API request: %s %s - Status: %d",
-                    method,
-                    endpoint,
-                    response.status,
-                )
-
-                # Handle 400 error by re-authenticating
-                if response.status == 400 and authenticated:
-                    _LOGGER.info("Received 400 error, attempting to re-authenticate")
-                    await self.authenticate()
-
+            for attempt in range(2):
+                if attempt:
                     # Retry request once with new token
+                    await self._reauthenticate(token_gen)
+
+                if authenticated and self._token:
                     headers[API_HEADER_AUTH] = self._token
-                    async with self._session.request(
+                token_gen = self._token_gen
+
+                async with self._sem, self._session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    timeout=timeout,
+                    **kwargs,
+                ) as response:
+                    _LOGGER.debug(
+                        "API request: %s %s - Status: %d",
                         method,
-                        url,
-                        headers=headers,
-                        timeout=timeout,
-                        **kwargs,
-                    ) as retry_response:
-                        retry_text = await retry_response.text()
-
-                        if retry_response.status != 200:
-                            raise RainsoftAuthError(
-                                f"Authentication retry failed with status {retry_response.status}"
-                            )
-
-                        try:
-                            return await retry_response.json()
-                        except Exception as err:
-                            _LOGGER.error("Failed to parse JSON response: %s", retry_text)
-                            raise RainsoftApiError(f"Invalid JSON response: {err}") from err
-
-                # Handle error status codes
-                if response.status == 401:
-                    raise RainsoftAuthError("Unauthorized - invalid credentials")
-                elif response.status == 404:
-                    raise RainsoftApiError(f"Endpoint not found: {endpoint}")
-                elif response.status >= 500:
-                    raise RainsoftConnectionError(
-                        f"Server error: {response.status}"
-                    )
-                elif response.status != 200:
-                    raise RainsoftApiError(
-                        f"API request failed with status {response.status}"
+                        endpoint,
+                        response.status,
                     )
 
-                # Parse JSON response
-                try:
-                    return await response.json()
-                except Exception as err:
-                    _LOGGER.error("Failed to parse JSON response: %s", response_text)
-                    raise RainsoftApiError(f"Invalid JSON response: {err}") from err
+                    # Handle 400 error by re-authenticating
+                    if response.status == 400 and authenticated and not attempt:
+                        _LOGGER.info("Received 400 error, attempting to re-authenticate")
+                        continue
+
+                    if response.status == 304 and cached:
+                        _LOGGER.debug("Not modified, reusing cached response")
+                        return cached[2]
+
+                    if attempt and response.status != 200:
+                        raise RainsoftAuthError(
+                            f"Authentication retry failed with status {response.status}"
+                        )
+
+                    # Handle error status codes
+                    if response.status == 401:
+                        raise RainsoftAuthError("Unauthorized - invalid credentials")
+                    elif response.status == 404:
+                        raise RainsoftApiError(f"Endpoint not found: {endpoint}")
+                    elif response.status >= 500:
+                        raise RainsoftConnectionError(
+                            f"Server error: {response.status}"
+                        )
+                    elif response.status != 200:
+                        raise RainsoftApiError(
+                            f"API request failed with status {response.status}"
+                        )
+
+                    # Parse JSON response
+                    try:
+                        data = await response.json(loads=orjson.loads)
+                    except Exception as err:
+                        _LOGGER.error(
+                            "Failed to parse JSON response: %s",
+                            await response.text(errors="replace"),
+                        )
+                        raise RainsoftApiError(f"Invalid JSON response: {err}") from err
+
+                    if method == "GET":
+                        etag = response.headers.get(aiohttp.hdrs.ETAG)
+                        last_modified = response.headers.get(aiohttp.hdrs.LAST_MODIFIED)
+                        if etag or last_modified:
+                            self._validators[url] = (etag, last_modified, data)
+                        else:
+                            self._validators.pop(url, None)
+
+                    return data
 
         except aiohttp.ClientError as err:
             _LOGGER.error("Connection error: %s", err)
@@ -10,12 +10,11 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, SALT_LOW_THRESHOLD
 from .coordinator import RainsoftDataUpdateCoordinator
+from .entity import RainsoftEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,79 +31,26 @@ async def async_setup_entry(
         entry: Config entry
         async_add_entities: Callback to add entities
     """
-    coordinator: RainsoftDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-    entities: list[BinarySensorEntity] = []
+    coordinator: RainsoftDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["state"]
 
     # Create binary sensors for each device
-    for device_id in coordinator.data:
-        entities.extend(
-            [
-                RainsoftSystemAlertSensor(coordinator, device_id),
-                RainsoftRegenerationSensor(coordinator, device_id),
-                RainsoftSaltLowSensor(coordinator, device_id),
-            ]
+    entities: list[BinarySensorEntity] = [
+        sensor_cls(coordinator, device_id)
+        for device_id in coordinator.data
+        for sensor_cls in (
+            RainsoftSystemAlertSensor,
+            RainsoftRegenerationSensor,
+            RainsoftSaltLowSensor,
         )
+    ]
 
     _LOGGER.debug("Adding %d binary sensor entities", len(entities))
     async_add_entities(entities)
 
 
-class RainsoftBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class RainsoftBinarySensor(RainsoftEntity, BinarySensorEntity):
     """Base Rainsoft binary sensor."""
 
-    def __init__(
-        self,
-        coordinator: RainsoftDataUpdateCoordinator,
-        device_id: str,
-        sensor_key: str,
-        name_suffix: str,
-    ) -> None:
-        """Initialize binary sensor.
-
-        Args:
-            coordinator: Data coordinator
-            device_id: Device ID
-            sensor_key: Key for sensor
-            name_suffix: Suffix for entity name
-        """
-        super().__init__(coordinator)
-        self._device_id = device_id
-        self._sensor_key = sensor_key
-        self._name_suffix = name_suffix
-        self._attr_unique_id = f"{device_id}_{sensor_key}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        device = self.coordinator.data.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("device_name", "Rainsoft Water Softener"),
-            manufacturer="Rainsoft",
-            model=device.get("model"),
-            sw_version=device.get("firmware_version"),
-        )
-
-    @property
-    def name(self) -> str:
-        """Return entity name."""
-        device = self.coordinator.data.get(self._device_id, {})
-        device_name = device.get("device_name", "Rainsoft Water Softener")
-        return f"{device_name} {self._name_suffix}"
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data
-        )
-
-    def _get_device_data(self) -> dict[str, Any]:
-        """Get device data from coordinator."""
-        return self.coordinator.data.get(self._device_id, {})
-
 
 class RainsoftSystemAlertSensor(RainsoftBinarySensor):
     """System alert binary sensor."""
@@ -122,22 +68,14 @@ class RainsoftSystemAlertSensor(RainsoftBinarySensor):
 
         Any status other than 'normal' is considered an alert.
         """
-        data = self._get_device_data()
-        status = data.get("system_status", "normal")
-
-        if not status:
-            return False
-
-        s = status.lower()
-        if "regenerat" in s:
-            return False
-        return s != "normal"
+        return self._cached_data.get("system_alert", False)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        data = self._get_device_data()
+        data = self._cached_data
         return {
+            **super().extra_state_attributes,
             "system_status": data.get("system_status"),
             "device_id": self._device_id,
         }
@@ -156,14 +94,14 @@ class RainsoftRegenerationSensor(RainsoftBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if regeneration is active."""
-        data = self._get_device_data()
-        return data.get("regeneration_active", False)
+        return self._cached_data.get("regeneration_active", False)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        data = self._get_device_data()
+        data = self._cached_data
         return {
+            **super().extra_state_attributes,
             "last_regeneration": data.get("last_regeneration"),
             "next_regeneration": data.get("next_regeneration"),
             "device_id": self._device_id,
@@ -188,19 +126,14 @@ class RainsoftSaltLowSensor(RainsoftBinarySensor):
         device class to represent salt level, where ON means low battery
         (low salt).
         """
-        data = self._get_device_data()
-        salt_level = data.get("salt_level")
-
-        if salt_level is None:
-            return False
-
-        return salt_level < SALT_LOW_THRESHOLD
+        return self._cached_data.get("salt_low", False)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        data = self._get_device_data()
+        data = self._cached_data
         return {
+            **super().extra_state_attributes,
             "salt_level_pct": data.get("salt_level"),
             "salt_lbs": data.get("salt_lbs"),
             "threshold_pct": SALT_LOW_THRESHOLD,
@@ -11,13 +11,27 @@ CONF_SCAN_INTERVAL = "scan_interval"
 DEFAULT_SCAN_INTERVAL = 2  # hours
 MIN_SCAN_INTERVAL = 1  # hour
 MAX_SCAN_INTERVAL = 4  # hours
+INFO_SCAN_INTERVAL = 24  # hours, device list and locations
+STALE_DATA_LIMIT = 12  # hours, last good data served during outages
+
+# Polling backoff while device data is unchanged
+SCAN_INTERVAL_BACKOFF = 1.5  # multiplier per unchanged poll
+MAX_BACKOFF_SCAN_INTERVAL = MAX_SCAN_INTERVAL * 2  # hours
 
 # API
 API_BASE_URL = "https://remind.rainsoft.com/api/remindapp/v2"
 API_TIMEOUT = 30  # seconds
+API_MAX_CONCURRENCY = 8  # simultaneous requests
+
+# API connection pool
+API_CONNECTION_LIMIT = 16
+API_CONNECTION_LIMIT_PER_HOST = 8
+API_DNS_CACHE_TTL = 300  # seconds
+API_KEEPALIVE_TIMEOUT = 75  # seconds
 
 # API Headers
 API_HEADER_ACCEPT = "application/json"
+API_HEADER_ACCEPT_ENCODING = "gzip, deflate"
 API_HEADER_ORIGIN = "ionic://localhost"
 API_HEADER_AUTH = "X-Remind-Auth-Token"
 
@@ -1,14 +1,18 @@
 """Data coordinator for Rainsoft integration."""
 from __future__ import annotations
 
-from datetime import timedelta
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
 import logging
+import time
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+import orjson
 
 from .api import (
     RainsoftApiClient,
@@ -16,134 +20,120 @@ from .api import (
     RainsoftAuthError,
     RainsoftConnectionError,
 )
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    INFO_SCAN_INTERVAL,
+    MAX_BACKOFF_SCAN_INTERVAL,
+    SALT_LOW_THRESHOLD,
+    SCAN_INTERVAL_BACKOFF,
+    STALE_DATA_LIMIT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Normalized key, API key and default for fields copied as-is
+_FIELD_MAP: tuple[tuple[str, str, Any], ...] = (
+    ("device_name", "name", "Rainsoft Water Softener"),
+    ("model", "model", None),
+    ("serial_number", "serialNumber", None),
+    ("firmware_version", "firmwareVersion", None),
+    ("system_status", "systemStatusName", "unknown"),
+    ("last_regeneration", "lastRegenDate", None),
+    ("next_regeneration", "regenTime", None),
+    ("location_id", "location_id", None),
+    ("location_name", "location_name", None),
+)
+
+# Normalized key and API key for counters, missing values become 0
+_INT_FIELDS: tuple[tuple[str, str], ...] = (
+    ("salt_28day", "salt28Day"),
+    ("capacity_remaining", "capacityRemaining"),
+    ("daily_water_use", "dailyWaterUse"),
+    ("water_28day", "water28Day"),
+    ("flow_since_last_regen", "flowSinceLastRegen"),
+    ("lifetime_flow", "lifeTimeFlow"),
+    ("hardness", "hardness"),
+    ("regens_28day", "regens28Day"),
+    ("regens_this_month", "regensThisMonth"),
+)
+
+# Normalized key and API key for measurements, missing values become 0.0
+_FLOAT_FIELDS: tuple[tuple[str, str], ...] = (
+    ("iron_level", "ironLevel"),
+    ("pressure", "pressure"),
+    ("drain_flow", "drainFlow"),
+)
+
 
-class RainsoftDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Rainsoft data from API."""
+class RainsoftCoordinator(DataUpdateCoordinator, ABC):
+    """Base coordinator translating Rainsoft API errors into update failures."""
 
     def __init__(
         self,
         hass: HomeAssistant,
         api: RainsoftApiClient,
+        name: str,
         update_interval: timedelta,
     ) -> None:
         """Initialize coordinator."""
         super().__init__(
             hass,
             _LOGGER,
-            name=DOMAIN,
+            name=name,
             update_interval=update_interval,
+            # Skip listener callbacks when a refresh returns identical data
+            always_update=False,
         )
         self.api = api
-        self.devices: list[dict[str, Any]] = []
+        # Whether data is the last good result served during an outage, and
+        # when that result was fetched
+        self.is_stale = False
+        self.last_good_update: datetime | None = None
+        self._last_good: dict[str, Any] | None = None
+        self._last_good_time = 0.0
+        # Set by _async_fetch_data when part of its result is carried over
+        # from an earlier refresh
+        self._fetch_stale = False
 
-    def _normalize_device_data(self, device: dict[str, Any]) -> dict[str, Any]:
-        """Normalize device data from API to expected format.
+    @abstractmethod
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch this coordinator's data, raising Rainsoft API errors as-is.
 
-        Accepts data from either /locations (uses "id") or /device/{id} (uses "deviceId").
+        Implementations set _fetch_stale if they return some earlier data
+        in place of entries that could not be fetched.
         """
-        salt_lbs = int(device.get("saltLbs") or 0)
-        max_salt = int(device.get("maxSalt") or 0)
-        salt_level = min(round(salt_lbs / max_salt * 100), 100) if max_salt else None
 
-        dealer = device.get("dealer") or {}
-
-        normalized = {
-            "id": device.get("id") or device.get("deviceId"),
-            "device_name": device.get("name", "Rainsoft Water Softener"),
-            "model": device.get("model"),
-            "serial_number": device.get("serialNumber"),
-            "firmware_version": device.get("firmwareVersion"),
-            # Salt
-            "salt_lbs": salt_lbs,
-            "max_salt": max_salt,
-            "salt_level": salt_level,
-            "salt_28day": int(device.get("salt28Day") or 0),
-            # Capacity and water usage
-            "capacity_remaining": int(device.get("capacityRemaining") or 0),
-            "daily_water_use": int(device.get("dailyWaterUse") or 0),
-            "water_28day": int(device.get("water28Day") or 0),
-            "flow_since_last_regen": int(device.get("flowSinceLastRegen") or 0),
-            "lifetime_flow": int(device.get("lifeTimeFlow") or 0),
-            # Water quality
-            "system_status": device.get("systemStatusName", "unknown"),
-            "hardness": int(device.get("hardness") or 0),
-            "iron_level": float(device.get("ironLevel") or 0.0),
-            "pressure": float(device.get("pressure") or 0.0),
-            "drain_flow": float(device.get("drainFlow") or 0.0),
-            # Regeneration
-            "last_regeneration": device.get("lastRegenDate"),
-            "next_regeneration": device.get("regenTime"),
-            "regens_28day": int(device.get("regens28Day") or 0),
-            "regens_this_month": int(device.get("regensThisMonth") or 0),
-            # Dealer
-            "dealer_name": dealer.get("name"),
-            "dealer_phone": dealer.get("phone"),
-            "dealer_email": dealer.get("email"),
-            # Location info
-            "location_id": device.get("location_id"),
-            "location_name": device.get("location_name"),
-        }
-
-        system_status = normalized["system_status"].lower() if normalized["system_status"] else ""
-        normalized["regeneration_active"] = "regenerat" in system_status and "queued" not in system_status
-
-        return normalized
+    def _last_good_is_recent(self) -> bool:
+        """Return whether the last fully fresh data may still be served."""
+        return (
+            self._last_good is not None
+            and time.monotonic() - self._last_good_time
+            < timedelta(hours=STALE_DATA_LIMIT).total_seconds()
+        )
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from API."""
-        try:
-            devices = await self.api.get_devices()
-
-            if not devices:
-                _LOGGER.warning("No devices found for this account")
-                return {}
+        """Authenticate and fetch data, mapping API errors for Home Assistant.
 
-            self.devices = devices
-
-            device_data: dict[str, Any] = {}
-            for device in devices:
-                device_id = device.get("id")
-                if not device_id:
-                    _LOGGER.warning("Device missing ID: %s", device)
-                    continue
-
-                # Try to get full detail from /device/{id} endpoint
-                try:
-                    detail = await self.api.get_device_detail(str(device_id))
-                    normalized = self._normalize_device_data(detail)
-                    # Preserve location info from the locations response
-                    normalized["location_id"] = device.get("location_id")
-                    normalized["location_name"] = device.get("location_name")
-                    normalized["id"] = str(device_id)
-                except Exception as err:
-                    _LOGGER.warning("Device detail fetch failed for %s, using basic data: %s", device_id, err)
-                    normalized = self._normalize_device_data(device)
-
-                device_data[str(device_id)] = normalized
-
-                _LOGGER.debug(
-                    "Updated device %s: salt=%s lbs (%s%%), capacity=%s%%, status=%s",
-                    device_id,
-                    normalized.get("salt_lbs"),
-                    normalized.get("salt_level"),
-                    normalized.get("capacity_remaining"),
-                    normalized.get("system_status"),
-                )
-
-            if not device_data:
-                raise UpdateFailed("No device data available")
-
-            return device_data
+        Connection errors serve the last good data while it is recent enough.
+        """
+        try:
+            # Log in once up front so concurrent requests don't each race
+            # to authenticate
+            await self.api.ensure_authenticated()
+            self._fetch_stale = False
+            data = await self._async_fetch_data()
 
         except RainsoftAuthError as err:
             _LOGGER.error("Authentication failed: %s", err)
             raise ConfigEntryAuthFailed("Authentication failed") from err
 
         except RainsoftConnectionError as err:
+            # Ride out transient outages on the last good data
+            if self._last_good_is_recent():
+                _LOGGER.warning("Connection error, keeping last known data: %s", err)
+                self._set_stale(True, self._last_good)
+                return self._last_good
+
             _LOGGER.error("Connection error: %s", err)
             raise UpdateFailed(f"Connection error: {err}") from err
 
@@ -154,3 +144,225 @@ class RainsoftDataUpdateCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.exception("Unexpected error fetching data: %s", err)
             raise UpdateFailed(f"Unexpected error: {err}") from err
+
+        self._set_stale(self._fetch_stale, data)
+        self._last_good = dict(data)
+        if not self._fetch_stale:
+            self._last_good_time = time.monotonic()
+            self.last_good_update = dt_util.utcnow()
+        return data
+
+    @callback
+    def _set_stale(self, stale: bool, data: dict[str, Any]) -> None:
+        """Update the stale flag for the data about to be stored.
+
+        If data differs from the current data, the refresh notifies entities
+        once it is stored. Otherwise always_update=False skips that state
+        write, so entities are notified here, where they already hold the
+        same data.
+        """
+        if stale == self.is_stale:
+            return
+        self.is_stale = stale
+        if self.data is not None and data == self.data:
+            self.async_update_listeners()
+
+
+class RainsoftInfoCoordinator(RainsoftCoordinator):
+    """Class to manage fetching the device list and locations.
+
+    Device metadata rarely changes, so this polls far less often than the
+    device state coordinator that consumes it.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: RainsoftApiClient) -> None:
+        """Initialize coordinator."""
+        super().__init__(
+            hass,
+            api,
+            name=f"{DOMAIN}_info",
+            update_interval=timedelta(hours=INFO_SCAN_INTERVAL),
+        )
+
+    async def _async_fetch_data(self) -> dict[str, dict[str, Any]]:
+        """Fetch devices from API, keyed by device ID."""
+        devices: dict[str, dict[str, Any]] = {}
+        async for device in self.api.iter_devices():
+            device_id = device.get("id")
+            if not device_id:
+                _LOGGER.warning("Device missing ID: %s", device)
+                continue
+            devices[str(device_id)] = device
+
+        _LOGGER.debug("Found %d device(s)", len(devices))
+        return devices
+
+
+class RainsoftDataUpdateCoordinator(RainsoftCoordinator):
+    """Class to manage fetching Rainsoft device state from API."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: RainsoftApiClient,
+        info_coordinator: RainsoftInfoCoordinator,
+        update_interval: timedelta,
+    ) -> None:
+        """Initialize coordinator."""
+        super().__init__(hass, api, name=DOMAIN, update_interval=update_interval)
+        self.info_coordinator = info_coordinator
+        self._base_update_interval = update_interval
+        # Hash of the last raw payload and its normalized form, keyed by device ID
+        self._last_raw_hash: dict[str, int] = {}
+        self._last_normalized: dict[str, dict[str, Any]] = {}
+
+    @callback
+    def async_handle_info_update(self) -> None:
+        """Refresh device state when the device list or locations change."""
+        self.hass.async_create_task(self.async_request_refresh())
+
+    def _normalize_device_data(self, device: dict[str, Any]) -> dict[str, Any]:
+        """Normalize device data from API to expected format.
+
+        Accepts data from either /locations (uses "id") or /device/{id} (uses "deviceId").
+        """
+        get = device.get
+
+        salt_lbs = int(get("saltLbs") or 0)
+        max_salt = int(get("maxSalt") or 0)
+        salt_level = min(round(salt_lbs / max_salt * 100), 100) if max_salt else None
+
+        normalized: dict[str, Any] = {
+            out_key: get(in_key, default) for out_key, in_key, default in _FIELD_MAP
+        }
+        for out_key, in_key in _INT_FIELDS:
+            normalized[out_key] = int(get(in_key) or 0)
+        for out_key, in_key in _FLOAT_FIELDS:
+            normalized[out_key] = float(get(in_key) or 0.0)
+
+        normalized["id"] = get("id") or get("deviceId")
+        # Salt
+        normalized["salt_lbs"] = salt_lbs
+        normalized["max_salt"] = max_salt
+        normalized["salt_level"] = salt_level
+        # Dealer
+        dealer = get("dealer") or {}
+        normalized["dealer_name"] = dealer.get("name")
+        normalized["dealer_phone"] = dealer.get("phone")
+        normalized["dealer_email"] = dealer.get("email")
+
+        system_status = normalized["system_status"]
+        status = system_status.casefold() if system_status is not None else ""
+        regenerating = "regenerat" in status
+
+        # Derived binary sensor states
+        normalized["regeneration_active"] = regenerating and "queued" not in status
+        # Any status other than 'normal' is an alert, except regeneration
+        normalized["system_alert"] = bool(status) and not regenerating and status != "normal"
+        normalized["salt_low"] = salt_level is not None and salt_level < SALT_LOW_THRESHOLD
+
+        return normalized
+
+    def _normalize_cached(self, device_id: str, device: dict[str, Any]) -> dict[str, Any]:
+        """Normalize device data, reusing the previous result if the payload is unchanged.
+
+        Payloads are compared by a hash of their sorted-key JSON encoding, so
+        the raw payloads themselves are not kept between refreshes.
+        """
+        raw_hash = hash(orjson.dumps(device, option=orjson.OPT_SORT_KEYS))
+        if raw_hash == self._last_raw_hash.get(device_id):
+            return self._last_normalized[device_id]
+
+        normalized = self._normalize_device_data(device)
+        self._last_raw_hash[device_id] = raw_hash
+        self._last_normalized[device_id] = normalized
+        return normalized
+
+    def _adjust_update_interval(self, device_data: dict[str, Any]) -> None:
+        """Back off polling while data is unchanged, reset on any change."""
+        if device_data != self.data:
+            if self.update_interval != self._base_update_interval:
+                _LOGGER.info(
+                    "Device data changed, polling every %s again",
+                    self._base_update_interval,
+                )
+                self.update_interval = self._base_update_interval
+            return
+
+        update_interval = min(
+            self.update_interval * SCAN_INTERVAL_BACKOFF,
+            timedelta(hours=MAX_BACKOFF_SCAN_INTERVAL),
+        )
+        if update_interval != self.update_interval:
+            _LOGGER.info("No changes detected, polling every %s", update_interval)
+            self.update_interval = update_interval
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch device state from API."""
+        devices_by_id: dict[str, dict[str, Any]] = self.info_coordinator.data or {}
+
+        if not devices_by_id:
+            _LOGGER.warning("No devices found for this account")
+            return {}
+
+        # Fetch full detail from /device/{id} for all devices concurrently
+        details = await self.api.get_all_device_statuses(list(devices_by_id))
+
+        # A failed login must reach the re-auth flow rather than be
+        # treated as a per-device failure
+        for detail in details.values():
+            if isinstance(detail, RainsoftAuthError):
+                raise detail
+
+        # If no device could be reached, fail so the last good data is
+        # served, or the update fails once it is too old
+        if all(isinstance(detail, RainsoftConnectionError) for detail in details.values()):
+            raise next(iter(details.values()))
+
+        # The /locations device list can be up to a day old, so a device whose
+        # detail request failed keeps its previous entry, marked stale
+        previous: dict[str, Any] = (self.data or {}) if self._last_good_is_recent() else {}
+        device_data: dict[str, Any] = {}
+        for device_id, device in devices_by_id.items():
+            detail = details[device_id]
+            try:
+                if isinstance(detail, BaseException):
+                    raise detail
+                # Preserve location info from the locations response
+                raw = {
+                    **detail,
+                    "id": device_id,
+                    "location_id": device.get("location_id"),
+                    "location_name": device.get("location_name"),
+                }
+                normalized = self._normalize_cached(device_id, raw)
+            except Exception as err:
+                if device_id not in previous:
+                    _LOGGER.warning("Device detail fetch failed for %s, skipping: %s", device_id, err)
+                    continue
+                _LOGGER.warning(
+                    "Device detail fetch failed for %s, keeping last known data: %s",
+                    device_id,
+                    err,
+                )
+                normalized = previous[device_id]
+                self._fetch_stale = True
+
+            device_data[device_id] = normalized
+
+            _LOGGER.debug(
+                "Updated device %s: salt=%s lbs (%s%%), capacity=%s%%, status=%s",
+                device_id,
+                normalized.get("salt_lbs"),
+                normalized.get("salt_level"),
+                normalized.get("capacity_remaining"),
+                normalized.get("system_status"),
+            )
+
+        if not device_data:
+            raise UpdateFailed("No device data available")
+
+        # Don't back off while carried-over data hides a failing device
+        if not self._fetch_stale:
+            self._adjust_update_interval(device_data)
+        return device_data
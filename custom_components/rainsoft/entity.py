@@ -0,0 +1,92 @@
+"""Base entity for Rainsoft integration."""
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import RainsoftDataUpdateCoordinator
+
+# Shared stand-in for a device missing from coordinator data
+_EMPTY: MappingProxyType[str, Any] = MappingProxyType({})
+
+
+class RainsoftEntity(CoordinatorEntity):
+    """Base Rainsoft entity for one device's coordinator data."""
+
+    # The Home Assistant base classes keep their __dict__; these slots only
+    # move this class's own fixed attributes out of it
+    __slots__ = ("_device_id", "_sensor_key", "_name_suffix", "_cached_data")
+
+    def __init__(
+        self,
+        coordinator: RainsoftDataUpdateCoordinator,
+        device_id: str,
+        sensor_key: str,
+        name_suffix: str,
+    ) -> None:
+        """Initialize entity.
+
+        Args:
+            coordinator: Data coordinator
+            device_id: Device ID
+            sensor_key: Key for entity
+            name_suffix: Suffix for entity name
+        """
+        super().__init__(coordinator)
+        self._device_id = device_id
+        self._sensor_key = sensor_key
+        self._name_suffix = name_suffix
+        self._attr_unique_id = f"{device_id}_{sensor_key}"
+        self._update_cached_data()
+
+    def _update_cached_data(self) -> None:
+        """Cache this device's data from the latest coordinator refresh."""
+        self._cached_data = self.coordinator.data.get(self._device_id) or _EMPTY
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached device data before writing state."""
+        self._update_cached_data()
+        super()._handle_coordinator_update()
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        device = self._cached_data
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._device_id)},
+            name=device.get("device_name", "Rainsoft Water Softener"),
+            manufacturer="Rainsoft",
+            model=device.get("model"),
+            sw_version=device.get("firmware_version"),
+        )
+
+    @property
+    def name(self) -> str:
+        """Return entity name."""
+        device_name = self._cached_data.get("device_name", "Rainsoft Water Softener")
+        return f"{device_name} {self._name_suffix}"
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return (
+            self.coordinator.last_update_success
+            and self._cached_data is not _EMPTY
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return attributes shared by all Rainsoft entities."""
+        if not self.coordinator.is_stale:
+            return {"stale": False}
+        last_update = self.coordinator.last_good_update
+        return {
+            "stale": True,
+            "last_successful_update": last_update.isoformat() if last_update else None,
+        }
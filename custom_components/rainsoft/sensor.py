@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 import logging
 from typing import Any
 
@@ -14,18 +15,45 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfMass, UnitOfPressure, UnitOfVolume
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import RainsoftDataUpdateCoordinator
+from .entity import RainsoftEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 UNIT_GPG = "gpg"       # grains per gallon
 UNIT_GPM = "gal/min"   # gallons per minute
 
+@lru_cache(maxsize=256)
+def _parse_iso(date_str: str) -> datetime | None:
+    """Parse an ISO datetime string, returning None if it is invalid.
+
+    Cached because native_value is read several times per state write while
+    the underlying string only changes around regenerations. Failures are
+    cached too, so a bad value is only logged once.
+    """
+    try:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except (ValueError, AttributeError) as err:
+        _LOGGER.warning("Could not parse datetime '%s': %s", date_str, err)
+        return None
+
+
+def _parse_dt(date_str: str | None) -> datetime | None:
+    """Parse ISO datetime string to timezone-aware datetime.
+
+    Naive values are localized here rather than in the cached parse, since
+    the Home Assistant time zone can change at runtime.
+    """
+    if not date_str:
+        return None
+    dt = _parse_iso(date_str)
+    if dt is not None and dt.tzinfo is None:
+        dt = dt_util.as_local(dt)
+    return dt
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -33,7 +61,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Rainsoft sensors from config entry."""
-    coordinator: RainsoftDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: RainsoftDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["state"]
 
     entities: list[SensorEntity] = []
 
@@ -69,68 +97,9 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class RainsoftSensor(CoordinatorEntity, SensorEntity):
+class RainsoftSensor(RainsoftEntity, SensorEntity):
     """Base Rainsoft sensor."""
 
-    def __init__(
-        self,
-        coordinator: RainsoftDataUpdateCoordinator,
-        device_id: str,
-        sensor_key: str,
-        name_suffix: str,
-    ) -> None:
-        """Initialize sensor."""
-        super().__init__(coordinator)
-        self._device_id = device_id
-        self._sensor_key = sensor_key
-        self._name_suffix = name_suffix
-        self._attr_unique_id = f"{device_id}_{sensor_key}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        device = self.coordinator.data.get(self._device_id, {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=device.get("device_name", "Rainsoft Water Softener"),
-            manufacturer="Rainsoft",
-            model=device.get("model"),
-            sw_version=device.get("firmware_version"),
-        )
-
-    @property
-    def name(self) -> str:
-        """Return entity name."""
-        device = self.coordinator.data.get(self._device_id, {})
-        device_name = device.get("device_name", "Rainsoft Water Softener")
-        return f"{device_name} {self._name_suffix}"
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data
-        )
-
-    def _get_device_data(self) -> dict[str, Any]:
-        """Get device data from coordinator."""
-        return self.coordinator.data.get(self._device_id, {})
-
-    @staticmethod
-    def _parse_dt(date_str: str | None) -> datetime | None:
-        """Parse ISO datetime string to timezone-aware datetime."""
-        if not date_str:
-            return None
-        try:
-            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            if dt.tzinfo is None:
-                dt = dt_util.as_local(dt)
-            return dt
-        except (ValueError, AttributeError) as err:
-            _LOGGER.warning("Could not parse datetime '%s': %s", date_str, err)
-            return None
-
 
 # ── Salt sensors ─────────────────────────────────────────────────────────────
 
@@ -147,13 +116,14 @@ class RainsoftSaltLevelSensor(RainsoftSensor):
     @property
     def native_value(self) -> int | None:
         """Return sensor value."""
-        return self._get_device_data().get("salt_lbs")
+        return self._cached_data.get("salt_lbs")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        data = self._get_device_data()
+        data = self._cached_data
         return {
+            **super().extra_state_attributes,
             "salt_pct": data.get("salt_level"),
             "max_salt_lbs": data.get("max_salt"),
         }
@@ -172,7 +142,7 @@ class RainsoftSaltPercentSensor(RainsoftSensor):
     @property
     def native_value(self) -> int | None:
         """Return sensor value."""
-        return self._get_device_data().get("salt_level")
+        return self._cached_data.get("salt_level")
 
 
 class RainsoftSalt28DaySensor(RainsoftSensor):
@@ -188,7 +158,7 @@ class RainsoftSalt28DaySensor(RainsoftSensor):
     @property
     def native_value(self) -> int | None:
         """Return sensor value."""
-        return self._get_device_data().get("salt_28day")
+        return self._cached_data.get("salt_28day")
 
 
 class RainsoftWeeklySaltSensor(RainsoftSensor):
@@ -204,7 +174,7 @@ class RainsoftWeeklySaltSensor(RainsoftSensor):
     @property
     def native_value(self) -> float | None:
         """Return sensor value."""
-        salt_28day = self._get_device_data().get("salt_28day")
+        salt_28day = self._cached_data.get("salt_28day")
         if salt_28day is None:
             return None
         return round(salt_28day / 4, 1)
@@ -225,13 +195,16 @@ class RainsoftCapacitySensor(RainsoftSensor):
     @property
     def native_value(self) -> int | None:
         """Return sensor value."""
-        return self._get_device_data().get("capacity_remaining")
+        return self._cached_data.get("capacity_remaining")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        data = self._get_device_data()
-        return {"flow_since_last_regen": data.get("flow_since_last_regen")}
+        data = self._cached_data
+        return {
+            **super().extra_state_attributes,
+            "flow_since_last_regen": data.get("flow_since_last_regen"),
+        }
 
 
 class RainsoftDailyWaterUseSensor(RainsoftSensor):
@@ -247,7 +220,7 @@ class RainsoftDailyWaterUseSensor(RainsoftSensor):
     @property
     def native_value(self) -> int | None:
         """Return sensor value."""
-        return self._get_device_data().get("daily_water_use")
+        return self._cached_data.get("daily_water_use")
 
 
 class RainsoftDailyWaterAvgSensor(RainsoftSensor):
@@ -263,7 +236,7 @@ class RainsoftDailyWaterAvgSensor(RainsoftSensor):
     @property
     def native_value(self) -> float | None:
         """Return sensor value."""
-        water_28day = self._get_device_data().get("water_28day")
+        water_28day = self._cached_data.get("water_28day")
         if not water_28day:
             return None
         return round(water_28day / 28, 1)
@@ -282,7 +255,7 @@ class RainsoftWater28DaySensor(RainsoftSensor):
     @property
     def native_value(self) -> int | None:
         """Return sensor value."""
-        return self._get_device_data().get("water_28day")
+        return self._cached_data.get("water_28day")
 
 
 class RainsoftFlowSinceLastRegenSensor(RainsoftSensor):
@@ -298,7 +271,7 @@ class RainsoftFlowSinceLastRegenSensor(RainsoftSensor):
     @property
     def native_value(self) -> int | None:
         """Return sensor value."""
-        return self._get_device_data().get("flow_since_last_regen")
+        return self._cached_data.get("flow_since_last_regen")
 
 
 class RainsoftLifetimeFlowSensor(RainsoftSensor):
@@ -314,7 +287,7 @@ class RainsoftLifetimeFlowSensor(RainsoftSensor):
     @property
     def native_value(self) -> int | None:
         """Return sensor value."""
-        return self._get_device_data().get("lifetime_flow")
+        return self._cached_data.get("lifetime_flow")
 
 
 # ── Water quality sensors ─────────────────────────────────────────────────────
@@ -332,7 +305,7 @@ class RainsoftHardnessSensor(RainsoftSensor):
     @property
     def native_value(self) -> int | None:
         """Return sensor value."""
-        return self._get_device_data().get("hardness")
+        return self._cached_data.get("hardness")
 
 
 class RainsoftIronLevelSensor(RainsoftSensor):
@@ -348,7 +321,7 @@ class RainsoftIronLevelSensor(RainsoftSensor):
     @property
     def native_value(self) -> float | None:
         """Return sensor value."""
-        return self._get_device_data().get("iron_level")
+        return self._cached_data.get("iron_level")
 
 
 # ── Regen cycle sensors ───────────────────────────────────────────────────────
@@ -365,7 +338,7 @@ class RainsoftRegens28DaySensor(RainsoftSensor):
     @property
     def native_value(self) -> int | None:
         """Return sensor value."""
-        return self._get_device_data().get("regens_28day")
+        return self._cached_data.get("regens_28day")
 
 
 class RainsoftLastRegenerationSensor(RainsoftSensor):
@@ -380,7 +353,7 @@ class RainsoftLastRegenerationSensor(RainsoftSensor):
     @property
     def native_value(self) -> datetime | None:
         """Return sensor value."""
-        return self._parse_dt(self._get_device_data().get("last_regeneration"))
+        return _parse_dt(self._cached_data.get("last_regeneration"))
 
 
 class RainsoftNextRegenerationSensor(RainsoftSensor):
@@ -395,7 +368,7 @@ class RainsoftNextRegenerationSensor(RainsoftSensor):
     @property
     def native_value(self) -> datetime | None:
         """Return sensor value."""
-        return self._parse_dt(self._get_device_data().get("next_regeneration"))
+        return _parse_dt(self._cached_data.get("next_regeneration"))
 
 
 # ── Real-time sensors ─────────────────────────────────────────────────────────
@@ -413,7 +386,7 @@ class RainsoftDrainFlowSensor(RainsoftSensor):
     @property
     def native_value(self) -> float | None:
         """Return sensor value."""
-        return self._get_device_data().get("drain_flow")
+        return self._cached_data.get("drain_flow")
 
 
 class RainsoftPressureSensor(RainsoftSensor):
@@ -430,4 +403,4 @@ class RainsoftPressureSensor(RainsoftSensor):
     @property
     def native_value(self) -> float | None:
         """Return sensor value."""
-        return self._get_device_data().get("pressure")
+        return self._cached_data.get("pressure")